@@ -11,6 +11,12 @@ try:
 except Exception:
     pass
 
+try:
+    # Optional: orjson serializes faster and writes bytes straight to stdout
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 from servicenow_mcp.utils.config import (
     ServerConfig,
     AuthConfig,
@@ -83,7 +89,11 @@ def main(argv: List[str]) -> int:
         SearchArticlesParams(keywords=keywords, limit=20, offset=0),
     )
 
-    print(json.dumps(result, indent=2))
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        sys.stdout.buffer.write(orjson.dumps(result, option=option))
+    else:
+        print(json.dumps(result, indent=2))
     return 0 if result.get("success") else 1
 
 
@@ -3,9 +3,12 @@ Authentication manager for the ServiceNow MCP server.
 """
 
 import base64
+import hashlib
 import logging
 import os
-from typing import Dict, Optional
+import threading
+import time
+from typing import Dict, Optional, Tuple
 
 import requests
 from requests.auth import HTTPBasicAuth
@@ -36,14 +39,71 @@ class AuthManager:
         self.instance_url = instance_url
         self.token: Optional[str] = None
         self.token_type: Optional[str] = None
+        # Headers are built once and reused until the OAuth token (if any) is
+        # close to expiry; _token_expiry_epoch is a time.monotonic() deadline.
+        self._cached_headers: Optional[Dict[str, str]] = None
+        self._token_expiry_epoch: Optional[float] = None
+        self._lock = threading.RLock()
     
     def get_headers(self) -> Dict[str, str]:
         """
         Get the authentication headers for API requests.
         
+        Headers are cached, so BASIC and API_KEY credentials are only encoded
+        once and an OAuth token is only requested again shortly before it expires.
+        
         Returns:
             Dict[str, str]: Headers to include in API requests.
         """
+        if self._cached_headers is not None and not self._token_expiring():
+            # Callers sometimes add headers (e.g. Content-Type), so hand out a copy.
+            return dict(self._cached_headers)
+
+        with self._lock:
+            # Another thread may have refreshed while we waited for the lock.
+            if self._cached_headers is None or self._token_expiring():
+                self._cached_headers = self._build_headers()
+            return dict(self._cached_headers)
+    
+    def headers_need_refresh(self) -> bool:
+        """
+        Return True if the next get_headers() call has to rebuild the headers.
+        
+        For OAuth a rebuild can block on a token request, so async callers use
+        this to move that call off the event loop.
+        """
+        return self._cached_headers is None or self._token_expiring()
+    
+    def cache_identity(self) -> Tuple[Optional[str], ...]:
+        """
+        Identify the configured credentials without exposing any secret.
+        
+        ServiceNow filters results by the caller's ACLs, so tools that cache
+        results include this in their cache keys. An API key is represented
+        by its SHA-256 digest.
+        """
+        if self.config.type == AuthType.BASIC and self.config.basic:
+            return (self.config.type.value, self.config.basic.username)
+        if self.config.type == AuthType.OAUTH and self.config.oauth:
+            return (
+                self.config.type.value,
+                self.config.oauth.client_id,
+                self.config.oauth.username,
+            )
+        if self.config.type == AuthType.API_KEY and self.config.api_key:
+            digest = hashlib.sha256(self.config.api_key.api_key.encode()).hexdigest()
+            return (self.config.type.value, digest)
+        return (self.config.type.value,)
+    
+    def _token_expiring(self) -> bool:
+        """Return True if the OAuth token expires within the next 30 seconds."""
+        return (
+            self._token_expiry_epoch is not None
+            and time.monotonic() >= self._token_expiry_epoch - 30
+        )
+    
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the authentication headers for the configured auth type."""
         headers = {
             "Accept": "application/json",
             "Content-Type": "application/json",
@@ -58,7 +118,7 @@ class AuthManager:
             headers["Authorization"] = f"Basic {encoded}"
         
         elif self.config.type == AuthType.OAUTH:
-            if not self.token:
+            if not self.token or self._token_expiring():
                 self._get_oauth_token()
             
             headers["Authorization"] = f"{self.token_type} {self.token}"
@@ -113,9 +173,7 @@ class AuthManager:
         logger.info(f"client_credentials response body: {response.text}")
         
         if response.status_code == 200:
-            token_data = response.json()
-            self.token = token_data.get("access_token")
-            self.token_type = token_data.get("token_type", "Bearer")
+            self._store_token(response.json())
             return
 
         # Try password grant if client_credentials failed
@@ -133,14 +191,23 @@ class AuthManager:
             logger.info(f"password grant response body: {response.text}")
             
             if response.status_code == 200:
-                token_data = response.json()
-                self.token = token_data.get("access_token")
-                self.token_type = token_data.get("token_type", "Bearer")
+                self._store_token(response.json())
                 return
 
         raise ValueError("Failed to get OAuth token using both client_credentials and password grants.")
     
+    def _store_token(self, token_data: Dict) -> None:
+        """Store an OAuth token response and its expiry deadline."""
+        self.token = token_data.get("access_token")
+        self.token_type = token_data.get("token_type", "Bearer")
+        expires_in = token_data.get("expires_in")
+        self._token_expiry_epoch = (
+            time.monotonic() + float(expires_in) if expires_in is not None else None
+        )
+    
     def refresh_token(self):
         """Refresh the OAuth token if using OAuth authentication."""
         if self.config.type == AuthType.OAUTH:
-            self._get_oauth_token() 
\ No newline at end of file
+            with self._lock:
+                self._get_oauth_token()
+                self._cached_headers = None
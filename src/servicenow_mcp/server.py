@@ -4,6 +4,7 @@ ServiceNow MCP Server
 This module provides the main implementation of the ServiceNow MCP server.
 """
 
+import ast
 import json
 import logging
 import os
@@ -32,6 +33,30 @@ logger = logging.getLogger(__name__)
 TOOL_PACKAGE_CONFIG_PATH = os.getenv("TOOL_PACKAGE_CONFIG_PATH", "config/tool_packages.yaml")
 
 
+def _coerce_str_list(value: Any) -> Any:
+    """
+    Coerce a list argument that a client sent as a string into a list of strings.
+
+    Tries JSON, then a Python literal, then a comma-separated list; any other
+    string becomes a one-item list. Non-list, non-string values are returned as is.
+    """
+    if isinstance(value, list):
+        return [str(x) for x in value]
+    if not isinstance(value, str):
+        return value
+    try:
+        parsed = json.loads(value)
+        return parsed if isinstance(parsed, list) else [value]
+    except Exception:
+        try:
+            parsed = ast.literal_eval(value)
+            return parsed if isinstance(parsed, list) else [value]
+        except Exception:
+            if "," in value:
+                return [s.strip() for s in value.split(",") if s.strip()]
+            return [value]
+
+
 def serialize_tool_output(result: Any, tool_name: str) -> str:
     """Serializes tool output to a string, preferably JSON indented."""
     try:
@@ -282,6 +307,8 @@ class ServiceNowMCP:
                     arguments["problem_number"] = arguments.pop("number")
                 if name == "get_article" and "id" in arguments and "article_id" not in arguments:
                     arguments["article_id"] = arguments.pop("id")
+                if name == "get_problems_by_numbers" and "numbers" in arguments and "problem_numbers" not in arguments:
+                    arguments["problem_numbers"] = arguments.pop("numbers")
 
                 # 3) Accept singular keyword/query and coerce to keywords list for search_* tools
                 if name.startswith("search_"):
@@ -299,32 +326,10 @@ class ServiceNowMCP:
                             except Exception:
                                 pass
 
-                # 5) Existing keywords coercion
-                if "keywords" in arguments:
-                    kw = arguments["keywords"]
-                    if isinstance(kw, str):
-                        try:
-                            parsed = json.loads(kw)
-                            if isinstance(parsed, list):
-                                arguments["keywords"] = parsed
-                            else:
-                                arguments["keywords"] = [kw]
-                        except Exception:
-                            try:
-                                import ast
-
-                                parsed = ast.literal_eval(kw)
-                                if isinstance(parsed, list):
-                                    arguments["keywords"] = parsed
-                                else:
-                                    arguments["keywords"] = [kw]
-                            except Exception:
-                                if "," in kw:
-                                    arguments["keywords"] = [s.strip() for s in kw.split(",") if s.strip()]
-                                else:
-                                    arguments["keywords"] = [kw]
-                    elif isinstance(kw, list):
-                        arguments["keywords"] = [str(x) for x in kw]
+                # 5) Coerce list arguments sent as strings (JSON, Python literal or CSV)
+                for list_key in ("keywords", "problem_numbers"):
+                    if list_key in arguments:
+                        arguments[list_key] = _coerce_str_list(arguments[list_key])
 
             params = params_model(**arguments)
             logger.debug(f"Parsed arguments for tool '{name}': {params}")
@@ -119,6 +119,7 @@ from servicenow_mcp.tools.project_tools import (
 from servicenow_mcp.tools.problem_tools import (
     list_problems,
     get_problem_by_number,
+    get_problems_by_numbers,
     search_problems,
 )
 # from servicenow_mcp.tools.problem_tools import create_problem, update_problem
@@ -234,6 +235,7 @@ __all__ = [
     # Problem tools (read-only)
     "list_problems",
     "get_problem_by_number",
+    "get_problems_by_numbers",
     "search_problems",
 
     
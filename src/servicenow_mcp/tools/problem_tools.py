@@ -2,20 +2,123 @@
 Problem tools for the ServiceNow MCP server.
 
 This module provides read-only tools for listing and retrieving Problem records
-from ServiceNow (table: problem).
+from ServiceNow (table: problem). Each tool also has an ``*_async`` variant
+that takes a shared httpx.AsyncClient so callers can run lookups concurrently.
+
+Records are held as slotted ProblemRecord / ProblemSummary dataclasses, which
+are much smaller than dicts when many are held in the result caches; callers
+always receive plain dicts (see _export).
 """
 
+import asyncio
+import importlib.util
+import json
 import logging
-from typing import Optional, List
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Optional, List, Tuple, Union
 
+import httpx
 import requests
 from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.cache import TTLCache
 from servicenow_mcp.utils.config import ServerConfig
 
+try:
+    # Optional speedup: orjson parses large Table API responses much faster
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Query parameters shared by every problem request (read-only template)
+_COMMON_PARAMS = MappingProxyType(
+    {
+        "sysparm_display_value": "true",
+        "sysparm_exclude_reference_link": "true",
+    }
+)
+
+# Fields read by _project_problem; requesting only these keeps ServiceNow from
+# serializing the whole (wide) problem record
+_PROBLEM_FIELDS = (
+    "sys_id,number,short_description,description,state,priority,assigned_to,"
+    "category,subcategory,sys_created_on,sys_updated_on"
+)
+
+# Keyword escaping for encoded queries: a literal ^ must be sent as ^^
+_QUERY_ESCAPES = str.maketrans({"^": "^^"})
+
+# Compact field set returned by search_problems
+_SEARCH_FIELDS = "sys_id,number,short_description,state,priority,sys_created_on,sys_updated_on"
+
+# Retry policy for transient failures, shared by the sync session and the
+# async GET path: up to 3 retries on these statuses with exponential backoff
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF_FACTOR = 0.3
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Shared HTTP session so repeated calls reuse keep-alive connections (and the
+# TLS session) instead of opening a new connection per request.
+_SESSION = requests.Session()
+_SESSION.headers.update({"Accept": "application/json"})
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=_RETRY_TOTAL,
+            backoff_factor=_RETRY_BACKOFF_FACTOR,
+            status_forcelist=_RETRY_STATUSES,
+            allowed_methods=["GET"],
+        ),
+    ),
+)
+
+
+# HTTP/2 lets concurrent async calls share one multiplexed connection; it
+# needs the optional h2 package (pip install "httpx[http2]").
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# ETag-validated results: key -> (etag, result). A cached entry is sent as
+# If-None-Match and reused when ServiceNow answers 304 Not Modified.
+_problem_cache = TTLCache(maxsize=512, ttl=300)
+_search_etag_cache = TTLCache(maxsize=256, ttl=300)
+
+# Recent results served without any request; agents often repeat the same
+# list or search within a turn. The short TTL bounds staleness.
+_search_cache = TTLCache(maxsize=256, ttl=60)
+_list_cache = TTLCache(maxsize=256, ttl=60)
+
+
+def close_session() -> None:
+    """Close the shared HTTP session and release its pooled connections."""
+    _SESSION.close()
+
+
+def clear_problem_cache() -> None:
+    """Drop all cached get_problem_by_number results."""
+    _problem_cache.clear()
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search_problems results."""
+    _search_cache.clear()
+    _search_etag_cache.clear()
+
+
+def clear_list_cache() -> None:
+    """Drop all cached list_problems results."""
+    _list_cache.clear()
+
 
 class ListProblemsParams(BaseModel):
     """Parameters for listing problems."""
@@ -26,6 +129,10 @@ class ListProblemsParams(BaseModel):
     assigned_to: Optional[str] = Field(None, description="Filter by assigned user sys_id")
     category: Optional[str] = Field(None, description="Filter by category")
     query: Optional[str] = Field(None, description="Search query across short_description/description")
+    include_total: bool = Field(
+        False,
+        description="Also return the total number of matching problems (one extra small request)",
+    )
 
 
 class GetProblemByNumberParams(BaseModel):
@@ -34,6 +141,14 @@ class GetProblemByNumberParams(BaseModel):
     problem_number: str = Field(..., description="Problem record number, e.g., PRB0010001")
 
 
+class GetProblemsByNumbersParams(BaseModel):
+    """Parameters for fetching several problems by number in one request."""
+
+    problem_numbers: List[str] = Field(
+        ..., description='Problem record numbers, e.g., ["PRB0010001", "PRB0010002"]'
+    )
+
+
 class SearchProblemsParams(BaseModel):
     """Parameters for keyword-based problem search (any-match)."""
 
@@ -42,6 +157,559 @@ class SearchProblemsParams(BaseModel):
     offset: int = Field(0, description="Offset for pagination")
 
 
+@dataclass(frozen=True, slots=True)
+class ProblemRecord:
+    """A problem from list_problems or get_problem_by_number(s), as held internally."""
+
+    sys_id: Optional[str]
+    number: Optional[str]
+    short_description: Optional[str]
+    description: Optional[str]
+    state: Optional[str]
+    priority: Optional[str]
+    assigned_to: Optional[str]
+    category: Optional[str]
+    subcategory: Optional[str]
+    created_on: Optional[str]
+    updated_on: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class ProblemSummary:
+    """A compact problem from search_problems, as held internally."""
+
+    sys_id: Optional[str]
+    number: Optional[str]
+    short_description: Optional[str]
+    state: Optional[str]
+    priority: Optional[str]
+    created_on: Optional[str]
+    updated_on: Optional[str]
+
+
+def create_async_client() -> httpx.AsyncClient:
+    """
+    Create an async HTTP client for the *_async problem tools.
+
+    One client should be created per process (or event loop) and shared across
+    calls so that concurrent requests reuse pooled connections. HTTP/2 is used
+    when h2 is installed, and failed connection attempts are retried; the
+    *_async tools additionally retry 429/5xx responses (see _get_with_retry).
+
+    Returns:
+        A configured httpx.AsyncClient. The caller owns it and must close it.
+    """
+    transport = httpx.AsyncHTTPTransport(
+        http2=_HTTP2,
+        retries=3,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+    )
+    return httpx.AsyncClient(
+        headers={"Accept": "application/json"},
+        http2=_HTTP2,
+        transport=transport,
+    )
+
+
+async def _get_headers_async(auth_manager: AuthManager) -> dict:
+    """Get auth headers without blocking the event loop on an OAuth token request."""
+    if auth_manager.headers_need_refresh():
+        return await asyncio.to_thread(auth_manager.get_headers)
+    return auth_manager.get_headers()
+
+
+async def _get_with_retry(
+    client: httpx.AsyncClient, url: str, **kwargs: Any
+) -> httpx.Response:
+    """
+    GET with the same status-based retry policy as the sync session.
+
+    httpx's transport retries only cover connection failures, so 429/5xx are
+    retried here, honouring a numeric Retry-After header when one is sent.
+    """
+    for attempt in range(_RETRY_TOTAL):
+        response = await client.get(url, **kwargs)
+        if response.status_code not in _RETRY_STATUSES:
+            return response
+        retry_after = response.headers.get("Retry-After", "")
+        delay = float(retry_after) if retry_after.isdigit() else _RETRY_BACKOFF_FACTOR * 2**attempt
+        logger.warning("Retrying %s after HTTP %s", url, response.status_code)
+        await asyncio.sleep(delay)
+    return await client.get(url, **kwargs)
+
+
+def _filter_query(params: ListProblemsParams) -> str:
+    """Build the encoded query for the list_problems filters ("" if none are set)."""
+    return "^".join(
+        f
+        for f in (
+            params.state and f"state={params.state}",
+            params.assigned_to and f"assigned_to={params.assigned_to}",
+            params.category and f"category={params.category}",
+            params.query and f"short_descriptionLIKE{params.query}^ORdescriptionLIKE{params.query}",
+        )
+        if f
+    )
+
+
+def _list_query_params(params: ListProblemsParams) -> dict:
+    """Build the Table API query parameters for list_problems."""
+    query_params = {
+        **_COMMON_PARAMS,
+        "sysparm_limit": params.limit,
+        "sysparm_offset": params.offset,
+        "sysparm_fields": _PROBLEM_FIELDS,
+    }
+
+    sysparm_query = _filter_query(params)
+    if sysparm_query:
+        query_params["sysparm_query"] = sysparm_query
+
+    return query_params
+
+
+def _count_query_params(params: ListProblemsParams) -> dict:
+    """Build the Aggregate API query parameters for count_problems."""
+    query_params = {"sysparm_count": "true"}
+
+    sysparm_query = _filter_query(params)
+    if sysparm_query:
+        query_params["sysparm_query"] = sysparm_query
+
+    return query_params
+
+
+def _count_result(data: dict) -> int:
+    """Read the record count from an Aggregate API response body."""
+    try:
+        return int(data["result"]["stats"]["count"])
+    except (KeyError, TypeError) as e:
+        raise ValueError(f"Unexpected stats response: {data}") from e
+
+
+def _get_query_params(params: GetProblemByNumberParams) -> dict:
+    """Build the Table API query parameters for get_problem_by_number."""
+    return {
+        **_COMMON_PARAMS,
+        "sysparm_query": f"number={params.problem_number}",
+        "sysparm_limit": 1,
+        "sysparm_fields": _PROBLEM_FIELDS,
+    }
+
+
+def _clean_problem_numbers(problem_numbers: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Strip and upper-case problem numbers and drop blanks and duplicates, keeping
+    the caller's order. Upper-casing matches the form ServiceNow returns, so
+    "missing" is computed correctly for numbers typed as e.g. "prb0010001".
+
+    Returns the cleaned numbers and any containing ^ or , which would break out of
+    (or split) the numberIN term of the encoded query.
+    """
+    stripped = [n for number in problem_numbers if (n := number.strip())]
+    invalid = [n for n in stripped if "^" in n or "," in n]
+    cleaned = list(dict.fromkeys(n.upper() for n in stripped))
+    return cleaned, invalid
+
+
+def _get_many_query_params(problem_numbers: List[str]) -> dict:
+    """Build a single numberIN query for get_problems_by_numbers."""
+    return {
+        **_COMMON_PARAMS,
+        "sysparm_query": f"numberIN{','.join(problem_numbers)}",
+        "sysparm_limit": len(problem_numbers),
+        "sysparm_fields": _PROBLEM_FIELDS,
+    }
+
+
+def _clean_keywords(keywords: List[str]) -> List[str]:
+    """Strip keywords, drop blank ones and escape ^ (encoded query separator) as ^^."""
+    return [kw.translate(_QUERY_ESCAPES) for k in keywords if k and (kw := k.strip())]
+
+
+def _search_query_params(keywords: List[str], params: SearchProblemsParams) -> dict:
+    """Build the Table API query parameters for search_problems from cleaned keywords."""
+    # OR chain across all keywords, searching both fields per keyword, joined
+    # with ^OR (ServiceNow encoded query OR operator)
+    sysparm_query = "^OR".join(
+        part
+        for kw in keywords
+        for part in (f"short_descriptionLIKE{kw}", f"descriptionLIKE{kw}")
+    )
+
+    return {
+        **_COMMON_PARAMS,
+        "sysparm_query": sysparm_query,
+        "sysparm_limit": params.limit,
+        "sysparm_offset": params.offset,
+        "sysparm_fields": _SEARCH_FIELDS,
+    }
+
+
+def _cache_scope(config: ServerConfig, auth_manager: AuthManager) -> tuple:
+    """
+    Leading part of every cache key: the instance and the caller's credentials.
+
+    ServiceNow ACLs filter results per user, so results fetched with one set of
+    credentials must never be served to another.
+    """
+    return (config.api_url, auth_manager.cache_identity())
+
+
+def _search_cache_key(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    keywords: List[str],
+    params: SearchProblemsParams,
+) -> tuple:
+    """Cache key for a search; keyword order does not change the result set."""
+    return (
+        _cache_scope(config, auth_manager),
+        tuple(sorted(keywords)),
+        params.limit,
+        params.offset,
+    )
+
+
+def _list_cache_key(
+    config: ServerConfig, auth_manager: AuthManager, params: ListProblemsParams
+) -> tuple:
+    """Cache key for a list_problems call: every filter plus paging."""
+    return (
+        _cache_scope(config, auth_manager),
+        params.limit,
+        params.offset,
+        params.state,
+        params.assigned_to,
+        params.category,
+        params.query,
+        params.include_total,
+    )
+
+
+def _export(result: dict) -> dict:
+    """
+    Copy a result for the caller, converting its records to plain dicts.
+
+    Results (and their records) stay internal and may be cached; callers get
+    fresh, JSON-ready dicts they are free to mutate.
+    """
+    exported = dict(result)
+    if "problem" in result:
+        exported["problem"] = asdict(result["problem"])
+    if "problems" in result:
+        exported["problems"] = [asdict(problem) for problem in result["problems"]]
+    return exported
+
+
+def _remember(
+    cache: TTLCache,
+    key: tuple,
+    response: Union[requests.Response, httpx.Response],
+    result: dict,
+) -> None:
+    """Cache a successful result under the response's ETag, if it sent one."""
+    etag = response.headers.get("ETag")
+    if result["success"] and etag:
+        cache[key] = (etag, result)
+
+
+def _project_problem(rec: dict) -> ProblemRecord:
+    """Project a Table API problem record onto a ProblemRecord."""
+    # Runs once per record, so bind rec.get once and use an exact type check
+    # (JSON objects always decode to plain dicts) instead of isinstance().
+    get = rec.get
+    at = get("assigned_to")
+
+    return ProblemRecord(
+        sys_id=get("sys_id"),
+        number=get("number"),
+        short_description=get("short_description"),
+        description=get("description"),
+        state=get("state"),
+        priority=get("priority"),
+        assigned_to=at.get("display_value") if at.__class__ is dict else at,
+        category=get("category"),
+        subcategory=get("subcategory"),
+        created_on=get("sys_created_on"),
+        updated_on=get("sys_updated_on"),
+    )
+
+
+def _project_problem_compact(rec: dict) -> ProblemSummary:
+    """Project a Table API problem record onto a ProblemSummary."""
+    get = rec.get
+
+    return ProblemSummary(
+        sys_id=get("sys_id"),
+        number=get("number"),
+        short_description=get("short_description"),
+        state=get("state"),
+        priority=get("priority"),
+        created_on=get("sys_created_on"),
+        updated_on=get("sys_updated_on"),
+    )
+
+
+def _list_result(data: dict) -> dict:
+    """Build the list_problems result from a Table API response body."""
+    problems = [_project_problem(rec) for rec in data.get("result", ())]
+
+    return {
+        "success": True,
+        "message": f"Found {len(problems)} problems",
+        "problems": problems,
+    }
+
+
+def _with_total(result: dict, total: Optional[int]) -> dict:
+    """Add include_total's count to a list_problems result (unchanged if it is None)."""
+    if total is None:
+        return result
+
+    return {
+        **result,
+        "message": f"Found {len(result['problems'])} of {total} problems",
+        "total": total,
+    }
+
+
+def _get_result(data: dict, problem_number: str) -> dict:
+    """Build the get_problem_by_number result from a Table API response body."""
+    result = data.get("result", [])
+    if not result:
+        return {
+            "success": False,
+            "message": f"Problem not found: {problem_number}",
+        }
+
+    return {
+        "success": True,
+        "message": f"Problem {problem_number} found",
+        "problem": _project_problem(result[0]),
+    }
+
+
+def _get_many_result(data: dict, problem_numbers: List[str]) -> dict:
+    """Build the get_problems_by_numbers result from a Table API response body."""
+    problems = [_project_problem(rec) for rec in data.get("result", ())]
+    found = {problem.number.upper() for problem in problems if problem.number}
+
+    return {
+        "success": True,
+        "message": f"Found {len(problems)} of {len(problem_numbers)} problems",
+        "problems": problems,
+        "missing": [number for number in problem_numbers if number not in found],
+    }
+
+
+def _search_result(data: dict) -> dict:
+    """Build the search_problems result from a Table API response body."""
+    problems = [_project_problem_compact(rec) for rec in data.get("result", ())]
+
+    return {
+        "success": True,
+        "message": f"Found {len(problems)} problems matching keywords",
+        "problems": problems,
+    }
+
+
+@dataclass(frozen=True)
+class _Request:
+    """
+    A prepared problem API GET, run by _execute or _execute_async.
+
+    Everything except the transport call lives here and in _handle_response, so
+    the sync and async tools share their caching and error handling.
+    """
+
+    url: str
+    params: dict
+    # Builds the tool result from the decoded response body
+    build: Callable[[dict], dict]
+    # Prefix of the error message, e.g. "Failed to list problems"
+    error: str
+    # List fields an error result carries (empty), e.g. ("problems",)
+    empty: Tuple[str, ...] = ()
+    key: Optional[tuple] = None
+    # Revalidated with If-None-Match (key -> (etag, result))
+    etag_cache: Optional[TTLCache] = None
+    # Successful results are stored here for reuse without a request
+    cache: Optional[TTLCache] = None
+
+
+def _etag_lookup(request: _Request, headers: dict) -> Optional[tuple]:
+    """Return the request's (etag, result) entry, if any, adding If-None-Match to headers."""
+    cached = request.etag_cache.get(request.key) if request.etag_cache is not None else None
+    if cached is not None:
+        headers["If-None-Match"] = cached[0]
+    return cached
+
+
+def _handle_response(
+    request: _Request,
+    cached: Optional[tuple],
+    response: Union[requests.Response, httpx.Response],
+) -> dict:
+    """Turn a response into the tool result, updating the request's caches."""
+    if cached is not None and response.status_code == 304:
+        result = cached[1]
+    else:
+        response.raise_for_status()
+        result = request.build(_json_loads(response.content))
+        if request.etag_cache is not None:
+            _remember(request.etag_cache, request.key, response, result)
+
+    if request.cache is not None and result["success"]:
+        request.cache[request.key] = result
+    return result
+
+
+def _failure(request: _Request, error: Exception) -> dict:
+    """Log a failed request and build its error result."""
+    logger.error("%s: %s", request.error, error)
+    return {
+        "success": False,
+        "message": f"{request.error}: {str(error)}",
+        **{field: [] for field in request.empty},
+    }
+
+
+def _execute(config: ServerConfig, auth_manager: AuthManager, request: _Request) -> dict:
+    """Send a prepared request on the shared session and build its result."""
+    try:
+        headers = auth_manager.get_headers()
+        cached = _etag_lookup(request, headers)
+        response = _SESSION.get(
+            request.url,
+            params=request.params,
+            headers=headers,
+            timeout=config.timeout,
+        )
+        return _handle_response(request, cached, response)
+
+    except (requests.RequestException, ValueError) as e:
+        return _failure(request, e)
+
+
+async def _execute_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    request: _Request,
+    client: httpx.AsyncClient,
+) -> dict:
+    """Async variant of _execute, sending the request on client."""
+    try:
+        headers = await _get_headers_async(auth_manager)
+        cached = _etag_lookup(request, headers)
+        response = await _get_with_retry(
+            client,
+            request.url,
+            params=request.params,
+            headers=headers,
+            timeout=config.timeout,
+        )
+        return _handle_response(request, cached, response)
+
+    except (httpx.HTTPError, ValueError) as e:
+        return _failure(request, e)
+
+
+def _plan_list(
+    config: ServerConfig, auth_manager: AuthManager, params: ListProblemsParams
+) -> Union[dict, _Request]:
+    """Return a cached list_problems result, or the request to send."""
+    key = _list_cache_key(config, auth_manager, params)
+    fresh = _list_cache.get(key)
+    if fresh is not None:
+        return fresh
+
+    # Cached by _cache_list_result, once any requested total has been added
+    return _Request(
+        url=config.problem_table_url,
+        params=_list_query_params(params),
+        build=_list_result,
+        error="Failed to list problems",
+        empty=("problems",),
+        key=key,
+    )
+
+
+def _cache_list_result(request: _Request, params: ListProblemsParams, result: dict) -> dict:
+    """Cache a successful list_problems result unless its requested total is missing."""
+    if result["success"] and ("total" in result or not params.include_total):
+        _list_cache[request.key] = result
+    return result
+
+
+def _get_request(
+    config: ServerConfig, auth_manager: AuthManager, params: GetProblemByNumberParams
+) -> _Request:
+    """Build the get_problem_by_number request."""
+    return _Request(
+        url=config.problem_table_url,
+        params=_get_query_params(params),
+        build=lambda data: _get_result(data, params.problem_number),
+        error="Failed to fetch problem",
+        key=(_cache_scope(config, auth_manager), params.problem_number),
+        etag_cache=_problem_cache,
+    )
+
+
+def _plan_get_many(
+    config: ServerConfig, params: GetProblemsByNumbersParams
+) -> Union[dict, _Request]:
+    """Return the get_problems_by_numbers result for invalid or no input, or the request."""
+    problem_numbers, invalid = _clean_problem_numbers(params.problem_numbers)
+    if invalid:
+        return {
+            "success": False,
+            "message": f"Invalid problem numbers: {', '.join(invalid)}",
+            "problems": [],
+            "missing": [],
+        }
+    if not problem_numbers:
+        return {
+            "success": True,
+            "message": "No problem numbers provided",
+            "problems": [],
+            "missing": [],
+        }
+
+    return _Request(
+        url=config.problem_table_url,
+        params=_get_many_query_params(problem_numbers),
+        build=lambda data: _get_many_result(data, problem_numbers),
+        error="Failed to fetch problems",
+        empty=("problems", "missing"),
+    )
+
+
+def _plan_search(
+    config: ServerConfig, auth_manager: AuthManager, params: SearchProblemsParams
+) -> Union[dict, _Request]:
+    """Return the search_problems result for blank keywords or a cache hit, or the request."""
+    keywords = _clean_keywords(params.keywords)
+    if not keywords:
+        return {"success": True, "message": "No valid keywords", "problems": []}
+
+    key = _search_cache_key(config, auth_manager, keywords, params)
+    fresh = _search_cache.get(key)
+    if fresh is not None:
+        return fresh
+
+    return _Request(
+        url=config.problem_table_url,
+        params=_search_query_params(keywords, params),
+        build=_search_result,
+        error="Failed to search problems",
+        empty=("problems",),
+        key=key,
+        etag_cache=_search_etag_cache,
+        cache=_search_cache,
+    )
+
+
 def list_problems(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -50,6 +718,9 @@ def list_problems(
     """
     List problem records from ServiceNow.
 
+    Identical calls within 60 seconds are served from an in-process cache. With
+    include_total, the true number of matches is fetched via count_problems.
+
     Args:
         config: Server configuration.
         auth_manager: Authentication manager.
@@ -58,74 +729,144 @@ def list_problems(
     Returns:
         Dictionary with list of problems and status.
     """
-    api_url = f"{config.api_url}/table/problem"
+    request = _plan_list(config, auth_manager, params)
+    if isinstance(request, dict):
+        return _export(request)
 
-    query_params = {
-        "sysparm_limit": params.limit,
-        "sysparm_offset": params.offset,
-        "sysparm_display_value": "true",
-        "sysparm_exclude_reference_link": "true",
-    }
+    result = _execute(config, auth_manager, request)
+    if result["success"] and params.include_total:
+        result = _with_total(result, _count_or_none(config, auth_manager, params))
+    return _export(_cache_list_result(request, params, result))
 
-    filters = []
-    if params.state:
-        filters.append(f"state={params.state}")
-    if params.assigned_to:
-        filters.append(f"assigned_to={params.assigned_to}")
-    if params.category:
-        filters.append(f"category={params.category}")
-    if params.query:
-        filters.append(f"short_descriptionLIKE{params.query}^ORdescriptionLIKE{params.query}")
 
-    if filters:
-        query_params["sysparm_query"] = "^".join(filters)
+async def list_problems_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: ListProblemsParams,
+    client: httpx.AsyncClient,
+) -> dict:
+    """
+    Async variant of list_problems.
 
-    try:
-        response = requests.get(
-            api_url,
-            params=query_params,
-            headers=auth_manager.get_headers(),
-            timeout=config.timeout,
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for listing problems.
+        client: Shared async client, see create_async_client().
+
+    Returns:
+        Dictionary with list of problems and status.
+    """
+    request = _plan_list(config, auth_manager, params)
+    if isinstance(request, dict):
+        return _export(request)
+
+    page = _execute_async(config, auth_manager, request, client)
+    if params.include_total:
+        # Issue the count alongside the page rather than after it
+        result, total = await asyncio.gather(
+            page, _count_or_none_async(config, auth_manager, params, client)
         )
-        response.raise_for_status()
+        if result["success"]:
+            result = _with_total(result, total)
+    else:
+        result = await page
+    return _export(_cache_list_result(request, params, result))
 
-        data = response.json()
-        problems = []
-
-        for rec in data.get("result", []):
-            assigned_to = rec.get("assigned_to")
-            if isinstance(assigned_to, dict):
-                assigned_to = assigned_to.get("display_value")
-
-            problems.append(
-                {
-                    "sys_id": rec.get("sys_id"),
-                    "number": rec.get("number"),
-                    "short_description": rec.get("short_description"),
-                    "description": rec.get("description"),
-                    "state": rec.get("state"),
-                    "priority": rec.get("priority"),
-                    "assigned_to": assigned_to,
-                    "category": rec.get("category"),
-                    "subcategory": rec.get("subcategory"),
-                    "created_on": rec.get("sys_created_on"),
-                    "updated_on": rec.get("sys_updated_on"),
-                }
-            )
 
-        return {
-            "success": True,
-            "message": f"Found {len(problems)} problems",
-            "problems": problems,
-        }
+def count_problems(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    filters: ListProblemsParams,
+) -> int:
+    """
+    Count problem records matching the list_problems filters.
+
+    Uses the Aggregate API (stats/problem?sysparm_count=true), so no records
+    are transferred. Paging fields on filters are ignored.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        filters: Filters to count by.
+
+    Returns:
+        Number of matching problems.
+
+    Raises:
+        requests.RequestException: If the request fails.
+        ValueError: If the response cannot be parsed.
+    """
+    response = _SESSION.get(
+        f"{config.api_url}/stats/problem",
+        params=_count_query_params(filters),
+        headers=auth_manager.get_headers(),
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
+
+    return _count_result(_json_loads(response.content))
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to list problems: {e}")
-        return {
-            "success": False,
-            "message": f"Failed to list problems: {str(e)}",
-            "problems": [],
-        }
+
+async def count_problems_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    filters: ListProblemsParams,
+    client: httpx.AsyncClient,
+) -> int:
+    """
+    Async variant of count_problems.
+
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        filters: Filters to count by.
+        client: Shared async client, see create_async_client().
+
+    Returns:
+        Number of matching problems.
+
+    Raises:
+        httpx.HTTPError: If the request fails.
+        ValueError: If the response cannot be parsed.
+    """
+    response = await _get_with_retry(
+        client,
+        f"{config.api_url}/stats/problem",
+        params=_count_query_params(filters),
+        headers=await _get_headers_async(auth_manager),
+        timeout=config.timeout,
+    )
+    response.raise_for_status()
+
+    return _count_result(_json_loads(response.content))
+
+
+def _count_or_none(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    filters: ListProblemsParams,
+) -> Optional[int]:
+    """count_problems for list_problems' include_total; a failed count yields None."""
+    try:
+        return count_problems(config, auth_manager, filters)
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("Failed to count problems: %s", e)
+        return None
+
+
+async def _count_or_none_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    filters: ListProblemsParams,
+    client: httpx.AsyncClient,
+) -> Optional[int]:
+    """Async variant of _count_or_none."""
+    try:
+        return await count_problems_async(config, auth_manager, filters, client)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.warning("Failed to count problems: %s", e)
+        return None
 
 
 def get_problem_by_number(
@@ -144,139 +885,108 @@ def get_problem_by_number(
     Returns:
         Dictionary with the problem details.
     """
-    api_url = f"{config.api_url}/table/problem"
+    return _export(_execute(config, auth_manager, _get_request(config, auth_manager, params)))
 
-    query_params = {
-        "sysparm_query": f"number={params.problem_number}",
-        "sysparm_limit": 1,
-        "sysparm_display_value": "true",
-        "sysparm_exclude_reference_link": "true",
-    }
-
-    try:
-        response = requests.get(
-            api_url,
-            params=query_params,
-            headers=auth_manager.get_headers(),
-            timeout=config.timeout,
-        )
-        response.raise_for_status()
 
-        result = response.json().get("result", [])
-        if not result:
-            return {
-                "success": False,
-                "message": f"Problem not found: {params.problem_number}",
-            }
-
-        rec = result[0]
-        assigned_to = rec.get("assigned_to")
-        if isinstance(assigned_to, dict):
-            assigned_to = assigned_to.get("display_value")
-
-        problem = {
-            "sys_id": rec.get("sys_id"),
-            "number": rec.get("number"),
-            "short_description": rec.get("short_description"),
-            "description": rec.get("description"),
-            "state": rec.get("state"),
-            "priority": rec.get("priority"),
-            "assigned_to": assigned_to,
-            "category": rec.get("category"),
-            "subcategory": rec.get("subcategory"),
-            "created_on": rec.get("sys_created_on"),
-            "updated_on": rec.get("sys_updated_on"),
-        }
+async def get_problem_by_number_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: GetProblemByNumberParams,
+    client: httpx.AsyncClient,
+) -> dict:
+    """
+    Async variant of get_problem_by_number.
 
-        return {
-            "success": True,
-            "message": f"Problem {params.problem_number} found",
-            "problem": problem,
-        }
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters for fetching the problem.
+        client: Shared async client, see create_async_client().
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to fetch problem: {e}")
-        return {
-            "success": False,
-            "message": f"Failed to fetch problem: {str(e)}",
-        }
+    Returns:
+        Dictionary with the problem details.
+    """
+    result = await _execute_async(
+        config, auth_manager, _get_request(config, auth_manager, params), client
+    )
+    return _export(result)
 
 
-def search_problems(
+def get_problems_by_numbers(
     config: ServerConfig,
     auth_manager: AuthManager,
-    params: SearchProblemsParams,
+    params: GetProblemsByNumbersParams,
 ) -> dict:
     """
-    Search problems by any of the provided keywords in short_description or description.
+    Fetch several problem records from ServiceNow in a single request.
 
-    Returns a compact result set to minimize LLM context usage.
-    """
-    api_url = f"{config.api_url}/table/problem"
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters listing the problem numbers to fetch.
 
-    if not params.keywords:
-        return {"success": True, "message": "No keywords provided", "problems": []}
+    Returns:
+        Dictionary with the problems found and the numbers that were not found.
+    """
+    request = _plan_get_many(config, params)
+    if isinstance(request, dict):
+        return _export(request)
+    return _export(_execute(config, auth_manager, request))
 
-    # Build OR chain across all keywords, searching both fields per keyword
-    or_parts: List[str] = []
-    for kw in params.keywords:
-        if not kw:
-            continue
-        or_parts.append(f"short_descriptionLIKE{kw}")
-        or_parts.append(f"descriptionLIKE{kw}")
 
-    if not or_parts:
-        return {"success": True, "message": "No valid keywords", "problems": []}
+async def get_problems_by_numbers_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: GetProblemsByNumbersParams,
+    client: httpx.AsyncClient,
+) -> dict:
+    """
+    Async variant of get_problems_by_numbers.
 
-    # Join with ^OR (ServiceNow encoded query OR operator)
-    sysparm_query = "^OR".join(or_parts)
+    Args:
+        config: Server configuration.
+        auth_manager: Authentication manager.
+        params: Parameters listing the problem numbers to fetch.
+        client: Shared async client, see create_async_client().
 
-    query_params = {
-        "sysparm_query": sysparm_query,
-        "sysparm_limit": params.limit,
-        "sysparm_offset": params.offset,
-        "sysparm_display_value": "true",
-        "sysparm_exclude_reference_link": "true",
-        # Return compact fields
-        "sysparm_fields": "sys_id,number,short_description,state,priority,sys_created_on,sys_updated_on",
-    }
+    Returns:
+        Dictionary with the problems found and the numbers that were not found.
+    """
+    request = _plan_get_many(config, params)
+    if isinstance(request, dict):
+        return _export(request)
+    return _export(await _execute_async(config, auth_manager, request, client))
 
-    try:
-        response = requests.get(
-            api_url,
-            params=query_params,
-            headers=auth_manager.get_headers(),
-            timeout=config.timeout,
-        )
-        response.raise_for_status()
 
-        data = response.json()
-        problems = []
-        for rec in data.get("result", []):
-            problems.append(
-                {
-                    "sys_id": rec.get("sys_id"),
-                    "number": rec.get("number"),
-                    "short_description": rec.get("short_description"),
-                    "state": rec.get("state"),
-                    "priority": rec.get("priority"),
-                    "created_on": rec.get("sys_created_on"),
-                    "updated_on": rec.get("sys_updated_on"),
-                }
-            )
+def search_problems(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: SearchProblemsParams,
+) -> dict:
+    """
+    Search problems by any of the provided keywords in short_description or description.
 
-        return {
-            "success": True,
-            "message": f"Found {len(problems)} problems matching keywords",
-            "problems": problems,
-        }
+    Returns a compact result set to minimize LLM context usage. Identical searches
+    within 60 seconds are served from an in-process cache.
+    """
+    request = _plan_search(config, auth_manager, params)
+    if isinstance(request, dict):
+        return _export(request)
+    return _export(_execute(config, auth_manager, request))
 
-    except requests.RequestException as e:
-        logger.error(f"Failed to search problems: {e}")
-        return {
-            "success": False,
-            "message": f"Failed to search problems: {str(e)}",
-            "problems": [],
-        }
 
+async def search_problems_async(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: SearchProblemsParams,
+    client: httpx.AsyncClient,
+) -> dict:
+    """
+    Async variant of search_problems.
 
+    Returns a compact result set to minimize LLM context usage.
+    """
+    request = _plan_search(config, auth_manager, params)
+    if isinstance(request, dict):
+        return _export(request)
+    return _export(await _execute_async(config, auth_manager, request, client))
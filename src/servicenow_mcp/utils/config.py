@@ -61,3 +61,8 @@ class ServerConfig(BaseModel):
     def api_url(self) -> str:
         """Get the API URL for the ServiceNow instance."""
         return f"{self.instance_url}/api/now"
+
+    @property
+    def problem_table_url(self) -> str:
+        """Get the Table API URL for problem records."""
+        return f"{self.api_url}/table/problem"
@@ -160,6 +160,12 @@ from servicenow_mcp.tools.problem_tools import (
 from servicenow_mcp.tools.problem_tools import (
     get_problem_by_number as get_problem_by_number_tool,
 )
+from servicenow_mcp.tools.problem_tools import (
+    GetProblemsByNumbersParams,
+)
+from servicenow_mcp.tools.problem_tools import (
+    get_problems_by_numbers as get_problems_by_numbers_tool,
+)
 from servicenow_mcp.tools.problem_tools import (
     SearchProblemsParams,
 )
@@ -457,6 +463,13 @@ def get_tool_definitions(
             "Get a specific problem by number",
             "json",
         ),
+        "get_problems_by_numbers": (
+            get_problems_by_numbers_tool,
+            GetProblemsByNumbersParams,
+            str,  # Expects JSON string
+            "Get several problems by number in one request",
+            "json",
+        ),
         "search_problems": (
             search_problems_tool,
             SearchProblemsParams,
@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
 from servicenow_mcp.utils.config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig, OAuthConfig, ApiKeyConfig
 from servicenow_mcp.auth.auth_manager import AuthManager
 from servicenow_mcp.tools.problem_tools import list_problems, get_problem_by_number, ListProblemsParams, GetProblemByNumberParams
@@ -28,15 +29,20 @@ else:
 config = ServerConfig(instance_url=instance_url, auth=cfg, timeout=30)
 auth = AuthManager(config.auth, config.instance_url)
 
-print("=== list_problems ===")
-print(list_problems(config, auth, ListProblemsParams(limit=5)))
-
 inc = os.getenv("TEST_INCIDENT_NUMBER")
-if inc:
-    print("=== get_incident_by_number ===")
-    print(get_incident_by_number(config, auth, GetIncidentByNumberParams(incident_number=inc)))
-
 prb = os.getenv("TEST_PROBLEM_NUMBER")
-if prb:
-    print("=== get_problem_by_number ===")
-    print(get_problem_by_number(config, auth, GetProblemByNumberParams(problem_number=prb)))
\ No newline at end of file
+
+# The three lookups are independent, so overlap them instead of paying each RTT in turn.
+# The problem tools share one pooled session, so the threads reuse its connections.
+with ThreadPoolExecutor(max_workers=3) as ex:
+    futures = {"list_problems": ex.submit(list_problems, config, auth, ListProblemsParams(limit=5))}
+    if inc:
+        futures["get_incident_by_number"] = ex.submit(
+            get_incident_by_number, config, auth, GetIncidentByNumberParams(incident_number=inc))
+    if prb:
+        futures["get_problem_by_number"] = ex.submit(
+            get_problem_by_number, config, auth, GetProblemByNumberParams(problem_number=prb))
+
+    for name, future in futures.items():
+        print(f"=== {name} ===")
+        print(future.result())
@@ -0,0 +1,78 @@
+import base64
+import unittest
+from unittest.mock import MagicMock, patch
+
+from servicenow_mcp.auth.auth_manager import AuthManager
+from servicenow_mcp.utils.config import AuthConfig, AuthType, BasicAuthConfig, OAuthConfig
+
+
+class TestAuthManager(unittest.TestCase):
+
+    def test_basic_headers_are_cached(self):
+        auth_manager = AuthManager(
+            AuthConfig(type=AuthType.BASIC, basic=BasicAuthConfig(username="test", password="test"))
+        )
+        self.assertTrue(auth_manager.headers_need_refresh())
+
+        with patch(
+            "servicenow_mcp.auth.auth_manager.base64.b64encode", wraps=base64.b64encode
+        ) as mock_encode:
+            first = auth_manager.get_headers()
+            first["Content-Type"] = "text/plain"
+            second = auth_manager.get_headers()
+
+        self.assertEqual(mock_encode.call_count, 1)
+        self.assertFalse(auth_manager.headers_need_refresh())
+        self.assertEqual(second["Content-Type"], "application/json")
+        self.assertTrue(second["Authorization"].startswith("Basic "))
+
+    @patch("servicenow_mcp.auth.auth_manager.time.monotonic")
+    @patch("servicenow_mcp.auth.auth_manager.requests.post")
+    def test_oauth_token_reused_until_expiry(self, mock_post, mock_monotonic):
+        auth_manager = AuthManager(
+            AuthConfig(
+                type=AuthType.OAUTH,
+                oauth=OAuthConfig(
+                    client_id="id",
+                    client_secret="secret",
+                    username="test",
+                    password="test",
+                    token_url="https://dev12345.service-now.com/oauth_token.do",
+                ),
+            )
+        )
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            "access_token": "TOKEN",
+            "token_type": "Bearer",
+            "expires_in": 1800,
+        }
+        mock_post.return_value = mock_response
+
+        mock_monotonic.return_value = 1000.0
+        self.assertEqual(auth_manager.get_headers()["Authorization"], "Bearer TOKEN")
+        mock_monotonic.return_value = 2000.0
+        auth_manager.get_headers()
+        self.assertEqual(mock_post.call_count, 1)
+
+        # Within 30 seconds of expiry the token is requested again.
+        mock_monotonic.return_value = 2780.0
+        self.assertTrue(auth_manager.headers_need_refresh())
+        auth_manager.get_headers()
+        self.assertEqual(mock_post.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
+
+    def test_cache_identity_distinguishes_users(self):
+        alice = AuthManager(
+            AuthConfig(type=AuthType.BASIC, basic=BasicAuthConfig(username="alice", password="a"))
+        )
+        bob = AuthManager(
+            AuthConfig(type=AuthType.BASIC, basic=BasicAuthConfig(username="bob", password="a"))
+        )
+
+        self.assertEqual(alice.cache_identity(), ("basic", "alice"))
+        self.assertNotEqual(alice.cache_identity(), bob.cache_identity())
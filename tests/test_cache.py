@@ -0,0 +1,45 @@
+"""
+Tests for the caching helpers.
+"""
+
+from unittest.mock import patch
+
+from servicenow_mcp.utils.cache import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the cache stays within maxsize."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+@patch("servicenow_mcp.utils.cache.time.monotonic")
+def test_ttl_cache_expires_entries(mock_monotonic):
+    """Test that entries expire after ttl seconds."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    mock_monotonic.return_value = 100.0
+    cache["a"] = 1
+    mock_monotonic.return_value = 159.0
+    assert cache.get("a") == 1
+    mock_monotonic.return_value = 160.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@patch("servicenow_mcp.utils.cache.time.monotonic")
+def test_ttl_cache_len_ignores_expired_entries(mock_monotonic):
+    """Test that len() does not count entries that have expired but were never read."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    mock_monotonic.return_value = 100.0
+    cache["a"] = 1
+    mock_monotonic.return_value = 130.0
+    cache["b"] = 2
+    mock_monotonic.return_value = 170.0
+    assert len(cache) == 1
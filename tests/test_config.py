@@ -116,6 +116,7 @@ def test_server_config():
     assert config.debug is False
     assert config.timeout == 30
     assert config.api_url == "https://example.service-now.com/api/now"
+    assert config.problem_table_url == "https://example.service-now.com/api/now/table/problem"
     
     config = ServerConfig(
         instance_url="https://example.service-now.com",
@@ -127,4 +128,7 @@ def test_server_config():
         timeout=60,
     )
     assert config.debug is True
-    assert config.timeout == 60 
\ No newline at end of file
+    assert config.timeout == 60
+
+    copied = config.model_copy(update={"instance_url": "https://other.service-now.com"})
+    assert copied.problem_table_url == "https://other.service-now.com/api/now/table/problem" 
\ No newline at end of file
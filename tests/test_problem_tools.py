@@ -1,14 +1,30 @@
+import json
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import requests
 
 from servicenow_mcp.tools.problem_tools import (
     list_problems,
     get_problem_by_number,
     ListProblemsParams,
     GetProblemByNumberParams,
+    get_problems_by_numbers,
+    GetProblemsByNumbersParams,
     search_problems,
     SearchProblemsParams,
+    list_problems_async,
+    get_problem_by_number_async,
+    get_problems_by_numbers_async,
+    search_problems_async,
+    clear_problem_cache,
+    clear_search_cache,
+    clear_list_cache,
+    count_problems,
+    count_problems_async,
 )
+from servicenow_mcp.server import _coerce_str_list, serialize_tool_output
 from servicenow_mcp.utils.config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig
 from servicenow_mcp.auth.auth_manager import AuthManager
 
@@ -20,8 +36,11 @@ class TestProblemTools(unittest.TestCase):
             type=AuthType.BASIC,
             basic=BasicAuthConfig(username="test", password="test"),
         )
+        clear_problem_cache()
+        clear_search_cache()
+        clear_list_cache()
 
-    @patch("requests.get")
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
     def test_list_problems_success(self, mock_get):
         config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
         auth_manager = MagicMock(spec=AuthManager)
@@ -29,7 +48,7 @@ class TestProblemTools(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "abc123",
@@ -45,7 +64,7 @@ class TestProblemTools(unittest.TestCase):
                     "sys_updated_on": "2025-06-26 09:00:00",
                 }
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         params = ListProblemsParams(limit=5, query="email")
@@ -55,8 +74,12 @@ class TestProblemTools(unittest.TestCase):
         self.assertIn("problems", result)
         self.assertEqual(len(result["problems"]), 1)
         self.assertEqual(result["problems"][0]["number"], "PRB0010001")
+        self.assertEqual(result["problems"][0]["assigned_to"], "Jane Admin")
+        query_params = mock_get.call_args.kwargs["params"]
+        self.assertEqual(query_params["sysparm_display_value"], "true")
+        self.assertIn("assigned_to", query_params["sysparm_fields"].split(","))
 
-    @patch("requests.get")
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
     def test_get_problem_by_number_success(self, mock_get):
         config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
         auth_manager = MagicMock(spec=AuthManager)
@@ -64,7 +87,8 @@ class TestProblemTools(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "abc123",
@@ -80,7 +104,7 @@ class TestProblemTools(unittest.TestCase):
                     "sys_updated_on": "2025-06-26 09:00:00",
                 }
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         params = GetProblemByNumberParams(problem_number="PRB0010001")
@@ -89,8 +113,12 @@ class TestProblemTools(unittest.TestCase):
         self.assertTrue(result["success"])
         self.assertIn("problem", result)
         self.assertEqual(result["problem"]["number"], "PRB0010001")
+        self.assertIsInstance(result["problem"], dict)
+        self.assertEqual(result["problem"].get("category"), "Software")
+        serialized = json.loads(serialize_tool_output(result, "get_problem_by_number"))
+        self.assertEqual(serialized["problem"]["assigned_to"], "Jane Admin")
 
-    @patch("requests.get")
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
     def test_get_problem_by_number_not_found(self, mock_get):
         config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
         auth_manager = MagicMock(spec=AuthManager)
@@ -98,7 +126,8 @@ class TestProblemTools(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"result": []}
+        mock_response.headers = {}
+        mock_response.content = json.dumps({"result": []}).encode()
         mock_get.return_value = mock_response
 
         params = GetProblemByNumberParams(problem_number="PRB0099999")
@@ -107,7 +136,82 @@ class TestProblemTools(unittest.TestCase):
         self.assertFalse(result["success"])
         self.assertEqual(result["message"], "Problem not found: PRB0099999")
 
-    @patch("requests.get")
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_get_problem_by_number_not_modified(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.side_effect = lambda: {"Authorization": "Bearer FAKE"}
+
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.headers = {"ETag": '"v1"'}
+        first_response.content = json.dumps({
+            "result": [{"sys_id": "abc123", "number": "PRB0010001", "short_description": "Email outage"}]
+        }).encode()
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [first_response, not_modified]
+
+        params = GetProblemByNumberParams(problem_number="PRB0010001")
+        first = get_problem_by_number(config, auth_manager, params)
+        second = get_problem_by_number(config, auth_manager, params)
+
+        self.assertEqual(second, first)
+        self.assertIsNot(second, first)
+        self.assertNotIn("If-None-Match", mock_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v1"')
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_get_problems_by_numbers_single_request(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({
+            "result": [
+                {"sys_id": "abc123", "number": "PRB0010001", "assigned_to": {"display_value": "Jane Admin"}},
+                {"sys_id": "def456", "number": "PRB0010003", "assigned_to": ""},
+            ]
+        }).encode()
+        mock_get.return_value = mock_response
+
+        params = GetProblemsByNumbersParams(
+            problem_numbers=["PRB0010001", " prb0010002", "PRB0010003 ", "prb0010001", "  "]
+        )
+        result = get_problems_by_numbers(config, auth_manager, params)
+
+        mock_get.assert_called_once()
+        query_params = mock_get.call_args.kwargs["params"]
+        self.assertEqual(query_params["sysparm_query"], "numberINPRB0010001,PRB0010002,PRB0010003")
+        self.assertEqual(query_params["sysparm_limit"], 3)
+        self.assertTrue(result["success"])
+        self.assertEqual([p["number"] for p in result["problems"]], ["PRB0010001", "PRB0010003"])
+        self.assertEqual(result["problems"][0]["assigned_to"], "Jane Admin")
+        self.assertEqual(result["missing"], ["PRB0010002"])
+
+    def test_problem_numbers_string_coercion(self):
+        for raw in ('["PRB1","PRB2"]', "['PRB1', 'PRB2']", "PRB1, PRB2"):
+            self.assertEqual(_coerce_str_list(raw), ["PRB1", "PRB2"])
+        self.assertEqual(_coerce_str_list("PRB1"), ["PRB1"])
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_get_problems_by_numbers_rejects_query_syntax(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+
+        for numbers in (["PRB1^ORnumberISNOTEMPTY"], ["PRB1,PRB2"]):
+            result = get_problems_by_numbers(
+                config, auth_manager, GetProblemsByNumbersParams(problem_numbers=numbers)
+            )
+            self.assertFalse(result["success"])
+            self.assertIn(numbers[0], result["message"])
+
+        mock_get.assert_not_called()
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
     def test_search_problems_keywords(self, mock_get):
         config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
         auth_manager = MagicMock(spec=AuthManager)
@@ -115,7 +219,8 @@ class TestProblemTools(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {
+        mock_response.headers = {}
+        mock_response.content = json.dumps({
             "result": [
                 {
                     "sys_id": "abc123",
@@ -127,7 +232,7 @@ class TestProblemTools(unittest.TestCase):
                     "sys_updated_on": "2025-06-21 09:00:00",
                 }
             ]
-        }
+        }).encode()
         mock_get.return_value = mock_response
 
         params = SearchProblemsParams(keywords=["Windows", "update"], limit=3)
@@ -137,6 +242,271 @@ class TestProblemTools(unittest.TestCase):
         self.assertIn("problems", result)
         self.assertEqual(result["problems"][0]["number"], "PRB0010002")
 
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_search_problems_cached(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({"result": [{"number": "PRB0010002"}]}).encode()
+        mock_get.return_value = mock_response
+
+        first = search_problems(config, auth_manager, SearchProblemsParams(keywords=["Windows", "update"]))
+        first["problems"][0]["number"] = "mutated"
+        first["problems"].clear()
+        first["message"] = "mutated"
+        second = search_problems(config, auth_manager, SearchProblemsParams(keywords=["update", "Windows"]))
+
+        mock_get.assert_called_once()
+        self.assertEqual(second["message"], "Found 1 problems matching keywords")
+        self.assertEqual(second["problems"][0]["number"], "PRB0010002")
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_search_problems_cache_not_shared_across_credentials(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        alice = MagicMock(spec=AuthManager)
+        alice.get_headers.return_value = {"Authorization": "Basic YWxpY2U="}
+        alice.cache_identity.return_value = ("basic", "alice")
+        bob = MagicMock(spec=AuthManager)
+        bob.get_headers.return_value = {"Authorization": "Basic Ym9i"}
+        bob.cache_identity.return_value = ("basic", "bob")
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({"result": [{"number": "PRB0010002"}]}).encode()
+        mock_get.return_value = mock_response
+
+        params = SearchProblemsParams(keywords=["Windows"])
+        search_problems(config, alice, params)
+        search_problems(config, bob, params)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_search_problems_failure_not_cached(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+        mock_get.side_effect = requests.ConnectionError("connection refused")
+
+        params = SearchProblemsParams(keywords=["Windows"])
+        search_problems(config, auth_manager, params)
+        result = search_problems(config, auth_manager, params)
+
+        self.assertFalse(result["success"])
+        self.assertEqual(mock_get.call_count, 2)
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_search_problems_cleans_keywords(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+
+        result = search_problems(config, auth_manager, SearchProblemsParams(keywords=["", "   "]))
+        self.assertTrue(result["success"])
+        self.assertEqual(result["problems"], [])
+        mock_get.assert_not_called()
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = json.dumps({"result": []}).encode()
+        mock_get.return_value = mock_response
+
+        search_problems(config, auth_manager, SearchProblemsParams(keywords=[" vpn^down ", ""]))
+        self.assertEqual(
+            mock_get.call_args.kwargs["params"]["sysparm_query"],
+            "short_descriptionLIKEvpn^^down^ORdescriptionLIKEvpn^^down",
+        )
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_count_problems(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"result": {"stats": {"count": "42"}}}).encode()
+        mock_get.return_value = mock_response
+
+        count = count_problems(config, auth_manager, ListProblemsParams(state="1", category="Software"))
+
+        self.assertEqual(count, 42)
+        self.assertEqual(mock_get.call_args.args[0], "https://dev12345.service-now.com/api/now/stats/problem")
+        self.assertEqual(
+            mock_get.call_args.kwargs["params"],
+            {"sysparm_count": "true", "sysparm_query": "state=1^category=Software"},
+        )
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_list_problems_include_total(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+
+        list_response = MagicMock()
+        list_response.status_code = 200
+        list_response.content = json.dumps({"result": [{"number": "PRB0010001"}]}).encode()
+        count_response = MagicMock()
+        count_response.status_code = 200
+        count_response.content = json.dumps({"result": {"stats": {"count": "57"}}}).encode()
+        mock_get.side_effect = [list_response, count_response]
+
+        result = list_problems(config, auth_manager, ListProblemsParams(limit=1, include_total=True))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["total"], 57)
+        self.assertEqual(result["message"], "Found 1 of 57 problems")
+
+    @patch("servicenow_mcp.tools.problem_tools._SESSION.get")
+    def test_list_problems_include_total_count_fails(self, mock_get):
+        config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=self.auth_config)
+        auth_manager = MagicMock(spec=AuthManager)
+        auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+
+        list_response = MagicMock()
+        list_response.status_code = 200
+        list_response.content = json.dumps({"result": [{"number": "PRB0010001"}]}).encode()
+        mock_get.side_effect = [list_response, requests.ConnectionError("stats unavailable")]
+
+        result = list_problems(config, auth_manager, ListProblemsParams(limit=1, include_total=True))
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["problems"][0]["number"], "PRB0010001")
+        self.assertNotIn("total", result)
+
+
+class TestProblemToolsAsync(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        auth_config = AuthConfig(
+            type=AuthType.BASIC,
+            basic=BasicAuthConfig(username="test", password="test"),
+        )
+        self.config = ServerConfig(instance_url="https://dev12345.service-now.com", auth=auth_config)
+        self.auth_manager = MagicMock(spec=AuthManager)
+        self.auth_manager.get_headers.return_value = {"Authorization": "Bearer FAKE"}
+        clear_problem_cache()
+        clear_search_cache()
+        clear_list_cache()
+
+    async def test_list_problems_async_success(self):
+        mock_response = MagicMock()
+        mock_response.content = json.dumps({
+            "result": [
+                {
+                    "sys_id": "abc123",
+                    "number": "PRB0010001",
+                    "short_description": "Email outage",
+                    "assigned_to": {"display_value": "Jane Admin"},
+                }
+            ]
+        }).encode()
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=mock_response)
+
+        result = await list_problems_async(
+            self.config, self.auth_manager, ListProblemsParams(limit=5), client
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["problems"][0]["number"], "PRB0010001")
+        self.assertEqual(result["problems"][0]["assigned_to"], "Jane Admin")
+        client.get.assert_awaited_once()
+
+    @patch("servicenow_mcp.tools.problem_tools.asyncio.sleep", new_callable=AsyncMock)
+    async def test_search_problems_async_retries_transient_status(self, mock_sleep):
+        unavailable = MagicMock()
+        unavailable.status_code = 503
+        unavailable.headers = {}
+        ok = MagicMock()
+        ok.status_code = 200
+        ok.headers = {}
+        ok.content = json.dumps({"result": [{"number": "PRB0010002"}]}).encode()
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(side_effect=[unavailable, ok])
+
+        result = await search_problems_async(
+            self.config, self.auth_manager, SearchProblemsParams(keywords=["Windows"]), client
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(client.get.await_count, 2)
+        mock_sleep.assert_awaited_once_with(0.3)
+
+    async def test_get_problem_by_number_async_error(self):
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(side_effect=httpx.ConnectError("connection refused"))
+
+        result = await get_problem_by_number_async(
+            self.config,
+            self.auth_manager,
+            GetProblemByNumberParams(problem_number="PRB0010001"),
+            client,
+        )
+
+        self.assertFalse(result["success"])
+        self.assertIn("connection refused", result["message"])
+
+    async def test_get_problems_by_numbers_async_reports_missing(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"result": [{"number": "PRB0010001"}]}).encode()
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=mock_response)
+
+        result = await get_problems_by_numbers_async(
+            self.config,
+            self.auth_manager,
+            GetProblemsByNumbersParams(problem_numbers=["prb0010001", "PRB0010002"]),
+            client,
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(
+            client.get.call_args.kwargs["params"]["sysparm_query"],
+            "numberINPRB0010001,PRB0010002",
+        )
+        self.assertEqual(result["missing"], ["PRB0010002"])
+
+    async def test_count_problems_async(self):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"result": {"stats": {"count": "42"}}}).encode()
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(return_value=mock_response)
+
+        count = await count_problems_async(
+            self.config, self.auth_manager, ListProblemsParams(state="1"), client
+        )
+
+        self.assertEqual(count, 42)
+        self.assertTrue(client.get.call_args.args[0].endswith("/stats/problem"))
+        self.assertEqual(client.get.call_args.kwargs["params"]["sysparm_query"], "state=1")
+
+    async def test_list_problems_async_include_total(self):
+        page = MagicMock()
+        page.status_code = 200
+        page.content = json.dumps({"result": [{"number": "PRB0010001"}]}).encode()
+        stats = MagicMock()
+        stats.status_code = 200
+        stats.content = json.dumps({"result": {"stats": {"count": "57"}}}).encode()
+        client = MagicMock(spec=httpx.AsyncClient)
+        client.get = AsyncMock(side_effect=lambda url, **kwargs: stats if "stats" in url else page)
+
+        result = await list_problems_async(
+            self.config, self.auth_manager, ListProblemsParams(limit=1, include_total=True), client
+        )
+
+        self.assertEqual(result["total"], 57)
+        self.assertEqual(result["message"], "Found 1 of 57 problems")
+        self.assertEqual(client.get.await_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()